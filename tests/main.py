@@ -5,11 +5,18 @@ Based on Postman collection and environment files
 """
 
 import json
+import math
 import requests
 import time
 import os
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import random
+import secrets
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Iterable, Iterator
+from urllib.parse import urlparse
+from dataclasses import dataclass, field
 from colorama import init, Fore, Back, Style
 import logging
 
@@ -35,6 +42,497 @@ class TestResult:
     duration: float = 0.0
 
 
+@dataclass
+class RequestSpan:
+    """Client-side span for a single harness request"""
+    trace_id: str
+    span_id: str
+    name: str
+    suite: str
+    step: int
+    method: str
+    url: str
+    endpoint: str
+    start_time_ns: int
+    end_time_ns: int = 0
+    status_code: int = 0
+    expected_status: Optional[int] = None
+    error_message: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def traceparent(self) -> str:
+        """W3C trace context header value for correlating with edge function logs"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+class RequestTracer:
+    """Instrumentation hooks and OTLP/JSON span export for harness requests"""
+
+    HOOK_EVENTS = ("before_request", "after_response", "on_error")
+
+    # Response headers copied onto spans (besides Server-Timing)
+    DIAGNOSTIC_HEADER_PREFIXES = ("x-", "sb-")
+
+    def __init__(self, sample_rate: float = 1.0, export_path: Optional[str] = None,
+                 service_name: str = "mommy-hai-api-tests", export_batch_size: int = 100):
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.export_path = export_path
+        self.service_name = service_name
+        self.export_batch_size = max(1, export_batch_size)
+        self.exported = 0
+        self.dropped = 0
+
+        # One trace per run, one span per request
+        self.trace_id = secrets.token_hex(16)
+        self.hooks: Dict[str, List[Callable]] = {event: [] for event in self.HOOK_EVENTS}
+        self.spans: List[RequestSpan] = []
+
+        # Current position in the run, set from print_header()
+        self.suite = ""
+        self.step = 0
+
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any span can be recorded or any hook fired"""
+        return self.sample_rate > 0 and (self.export_path is not None or any(self.hooks.values()))
+
+    def add_hook(self, event: str, callback: Callable):
+        """Register a callback for before_request, after_response or on_error"""
+        if event not in self.hooks:
+            raise ValueError(f"Unknown hook event: {event}")
+        self.hooks[event].append(callback)
+
+    def begin_suite(self, suite: str):
+        """Start a new suite; subsequent requests are numbered from step 1"""
+        with self._lock:
+            self.suite = suite
+            self.step = 0
+
+    def start_span(self, name: str, method: str, url: str,
+                   headers: Dict[str, str]) -> Optional[RequestSpan]:
+        """Open a span and inject traceparent into headers; None when not sampled"""
+        with self._lock:
+            self.step += 1
+            step = self.step
+            suite = self.suite
+
+        if not self.enabled or (self.sample_rate < 1.0 and random.random() >= self.sample_rate):
+            return None
+
+        path = urlparse(url).path
+        span = RequestSpan(
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            name=name,
+            suite=suite,
+            step=step,
+            method=method.upper(),
+            url=url,
+            endpoint=path.split("/functions/v1/", 1)[-1].lstrip("/"),
+            start_time_ns=time.time_ns()
+        )
+        headers["traceparent"] = span.traceparent
+
+        self._fire("before_request", span, headers)
+        return span
+
+    def end_span(self, span: Optional[RequestSpan], response: requests.Response,
+                 expected_status: Optional[int] = None):
+        """Close a span with the response status and diagnostic headers"""
+        if span is None:
+            return
+
+        span.end_time_ns = time.time_ns()
+        span.status_code = response.status_code
+        span.expected_status = expected_status
+        span.attributes["http.time_to_headers_ms"] = response.elapsed.total_seconds() * 1000
+
+        for header, value in response.headers.items():
+            header = header.lower()
+            if header == "server-timing":
+                span.attributes.update(self.parse_server_timing(value))
+            elif header.startswith(self.DIAGNOSTIC_HEADER_PREFIXES):
+                span.attributes[f"http.response.header.{header}"] = value
+
+        if expected_status is not None and response.status_code != expected_status:
+            span.error_message = f"Status code mismatch: got {response.status_code}, expected {expected_status}"
+
+        self._fire("after_response", span, response)
+        self._record(span)
+
+    def fail_span(self, span: Optional[RequestSpan], error: Exception):
+        """Close a span for a request that raised before a response arrived"""
+        if span is None:
+            return
+
+        span.end_time_ns = time.time_ns()
+        span.error_message = str(error)
+        span.attributes["exception.type"] = type(error).__name__
+
+        self._fire("on_error", span, error)
+        self._record(span)
+
+    @staticmethod
+    def parse_server_timing(value: str) -> Dict[str, float]:
+        """Turn 'db;dur=12.5, auth;dur=3' into server_timing.* span attributes (ms)"""
+        timings = {}
+        for metric in value.split(","):
+            name, *params = [part.strip() for part in metric.split(";")]
+            if not name:
+                continue
+            for param in params:
+                key, _, duration = param.partition("=")
+                if key.strip().lower() != "dur":
+                    continue
+                try:
+                    timings[f"server_timing.{name}"] = float(duration.strip().strip('"'))
+                except ValueError:
+                    logger.debug(f"Skipping malformed Server-Timing metric: {metric!r}")
+                break
+        return timings
+
+    def export(self) -> int:
+        """Append buffered spans to export_path as one OTLP/JSON line; returns spans written
+
+        A failed write is logged and the batch counted as dropped, so export never
+        raises into a request or the end-of-run flush.
+        """
+        with self._lock:
+            spans, self.spans = self.spans, []
+
+        if not self.export_path or not spans:
+            return 0
+
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [self._otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": self.service_name},
+                    "spans": [self._otlp_span(span) for span in spans]
+                }]
+            }]
+        }
+
+        with self._export_lock:
+            try:
+                with open(self.export_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(payload) + "\n")
+            except OSError as e:
+                self.dropped += len(spans)
+                logger.warning(f"Dropped {len(spans)} spans, could not write {self.export_path}: {e}")
+                return 0
+            self.exported += len(spans)
+        return len(spans)
+
+    def _fire(self, event: str, *args):
+        """Run hooks for an event; a failing hook never fails the request"""
+        for callback in self.hooks[event]:
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.warning(f"{event} hook {getattr(callback, '__name__', callback)} failed: {e}")
+
+    def _record(self, span: RequestSpan):
+        if self.export_path is None:
+            return
+        with self._lock:
+            self.spans.append(span)
+            flush = len(self.spans) >= self.export_batch_size
+
+        if flush:
+            self.export()
+
+    def _otlp_span(self, span: RequestSpan) -> Dict[str, Any]:
+        attributes = {
+            "test.suite": span.suite,
+            "test.step": span.step,
+            "http.request.method": span.method,
+            "url.full": span.url,
+            "endpoint": span.endpoint,
+            "http.response.status_code": span.status_code,
+            **span.attributes
+        }
+        if span.expected_status is not None:
+            attributes["test.expected_status"] = span.expected_status
+
+        status = {"code": 2, "message": span.error_message} if span.error_message else {"code": 1}
+
+        return {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 3,  # SPAN_KIND_CLIENT
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.end_time_ns),
+            "attributes": [self._otlp_attribute(key, value) for key, value in attributes.items()],
+            "status": status
+        }
+
+    @staticmethod
+    def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+        if isinstance(value, bool):
+            return {"key": key, "value": {"boolValue": value}}
+        if isinstance(value, int):
+            return {"key": key, "value": {"intValue": str(value)}}
+        if isinstance(value, float):
+            return {"key": key, "value": {"doubleValue": value}}
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+
+@dataclass
+class FuzzCase:
+    """Single generated invalid request for the validation fuzzer"""
+    category: str
+    payload: Optional[Any] = None
+    raw_body: Optional[str] = None
+    accepted_statuses: tuple = (400,)
+
+
+class ValidationFuzzer:
+    """Generates payloads that the contacts/partners validators must reject with 400"""
+
+    # Field rules mirrored from ContactsApiController / PartnersApiController
+    SCHEMAS = {
+        "contacts": {
+            "valid": {
+                "first_name": "John",
+                "last_name": "Doe",
+                "phone_no": "+1234567890",
+                "email": "john.doe@example.com"
+            },
+            "required": ["first_name", "last_name"],
+            "non_empty": ["phone_no"],
+            "emails": ["email"],
+            "uuids": [],
+            "phones": [],
+            "flags": []
+        },
+        "partners": {
+            "valid": {
+                "company_name": "Advanced Manufacturing Corp",
+                "tax_id": "987654321",
+                "registration_number": "REG-2024-001",
+                "address": "123 Business Street, Suite 100, City, State 12345",
+                "bank_account": "1234567890123456",
+                "bank_name": "First National Bank",
+                "administrator_contact_id": "3f1c1d2e-8a4b-4c6d-9e0f-1a2b3c4d5e6f",
+                "is_active": True,
+                "business_email": "info@advancedmfg.com",
+                "orders_email": "orders@advancedmfg.com",
+                "phone_number": "+40712345678"
+            },
+            "required": ["company_name", "tax_id"],
+            "non_empty": ["registration_number", "address", "bank_account", "bank_name"],
+            "emails": ["business_email", "orders_email"],
+            "uuids": ["administrator_contact_id"],
+            "phones": ["phone_number"],
+            "flags": ["is_active"]
+        }
+    }
+
+    # Stripped by String.prototype.trim(), so these count as blank server-side
+    BLANK_STRINGS = [" ", "   ", "\t", "\n  \r", "\u00a0", "\u2003\u3000", "\ufeff", "\u2028 \u2029"]
+
+    WRONG_TYPES = [0, 123, -1.5, True, False, None, [], ["value"], {}, {"value": "nested"}]
+
+    BAD_EMAILS = [
+        "plainaddress", "john@", "@example.com", "john@example", "john doe@example.com",
+        "john@exa mple.com", "john@@example.com", "john@example.", "jöhn@exämple", "📧@📧"
+    ]
+
+    BAD_UUIDS = ["not-a-uuid", "1234", "3f1c1d2e-8a4b-4c6d-9e0f", "zzzzzzzz-zzzz-4zzz-8zzz-zzzzzzzzzzzz",
+                 "3f1c1d2e-8a4b-0c6d-9e0f-1a2b3c4d5e6f"]
+
+    BAD_PHONES = ["123", "phone", "+40 712 345 678", "+4071234567890123", "++40712345678", "\u0660\u0667\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"]
+
+    BAD_FLAGS = ["yes", "true", "2", 2, -1, [], {}]
+
+    UNICODE_NOISE = [
+        "Zo\u00eb \u00d1\u00fa\u00f1ez", "\u674e\u5c0f\u9f99", "\u0645\u062d\u0645\u062f", "\u202egnirts desrever", "e\u0301\u0301\u0301",
+        "🚀🔥💥" * 8, "\u0000null byte", "\ud800", "<script>alert(1)</script>", "'; DROP TABLE contacts; --"
+    ]
+
+    # oversized_body padding, built on first use and shared between cases
+    PADDING_SIZES = [512 * 1024, 1024 * 1024, 4 * 1024 * 1024]
+    _paddings: List[str] = []
+
+    # Dominated by client upload time, so kept out of the aggregate reject latency
+    UPLOAD_BOUND_CATEGORIES = ("oversized_body",)
+
+    # Category used for valid contact writes interleaved into a fuzz run
+    VALID_WRITE = "valid_write"
+
+    MALFORMED_BODIES = ["", "{", "not json", "{'first_name': 'single quotes'}", "null", "[]",
+                        "\"string\"", "123", "true", "{\"first_name\": }", "{\"a\":1,,}"]
+
+    def __init__(self, endpoint: str, seed: int):
+        self.schema = self.SCHEMAS[endpoint]
+        self.rng = random.Random(seed)
+
+        self.categories = ["missing_field", "blank_field", "wrong_type", "huge_string",
+                           "unicode", "deep_nesting", "oversized_body", "malformed_json"]
+        if self.schema["emails"]:
+            self.categories.append("bad_email")
+        if self.schema["uuids"]:
+            self.categories.append("bad_uuid")
+        if self.schema["phones"]:
+            self.categories.append("bad_phone")
+        if self.schema["flags"]:
+            self.categories.append("bad_flag")
+
+    @classmethod
+    def paddings(cls) -> List[str]:
+        if not cls._paddings:
+            cls._paddings = ["x" * size for size in cls.PADDING_SIZES]
+        return cls._paddings
+
+    def generate(self, count: int) -> Iterator[FuzzCase]:
+        """Lazily generate count cases spread evenly over the applicable categories"""
+        for i in range(count):
+            yield self.mutate(self.categories[i % len(self.categories)])
+
+    def mutate(self, category: str) -> FuzzCase:
+        rng = self.rng
+        payload = dict(self.schema["valid"])
+        required = self.schema["required"]
+
+        if category == "missing_field":
+            for name in rng.sample(required, rng.randint(1, len(required))):
+                del payload[name]
+            return FuzzCase(category, payload)
+
+        if category == "blank_field":
+            name = rng.choice(required + self.schema["non_empty"])
+            blanks = self.BLANK_STRINGS + ([""] if name in required else [])
+            payload[name] = rng.choice(blanks)
+            return FuzzCase(category, payload)
+
+        if category == "wrong_type":
+            payload[rng.choice(required)] = rng.choice(self.WRONG_TYPES)
+            return FuzzCase(category, payload)
+
+        if category == "bad_email":
+            payload[rng.choice(self.schema["emails"])] = rng.choice(self.BAD_EMAILS)
+            return FuzzCase(category, payload)
+
+        if category == "bad_uuid":
+            payload[rng.choice(self.schema["uuids"])] = rng.choice(self.BAD_UUIDS)
+            return FuzzCase(category, payload)
+
+        if category == "bad_phone":
+            payload[rng.choice(self.schema["phones"])] = rng.choice(self.BAD_PHONES)
+            return FuzzCase(category, payload)
+
+        if category == "bad_flag":
+            payload[rng.choice(self.schema["flags"])] = rng.choice(self.BAD_FLAGS)
+            return FuzzCase(category, payload)
+
+        if category == "huge_string":
+            size = rng.choice([10_000, 50_000, 200_000])
+            if self.schema["emails"] and rng.random() < 0.5:
+                payload[rng.choice(self.schema["emails"])] = "a" * size
+            else:
+                payload[rng.choice(required)] = " " * size
+            return FuzzCase(category, payload)
+
+        if category == "unicode":
+            # Noise in every string field, blank-after-trim unicode in a required one
+            for name, value in payload.items():
+                if isinstance(value, str):
+                    payload[name] = rng.choice(self.UNICODE_NOISE)
+            payload[rng.choice(required)] = rng.choice(self.BLANK_STRINGS[4:])
+            for name in self.schema["emails"]:
+                payload[name] = rng.choice(self.BAD_EMAILS)
+            return FuzzCase(category, payload)
+
+        if category == "deep_nesting":
+            name = rng.choice(required)
+            del payload[name]
+            depth = rng.choice([64, 512, 4096])
+            opener, closer = rng.choice([("[", "]"), ('{"a":', "}")])
+            nested = opener * depth + "1" + closer * depth
+            raw_body = json.dumps(payload)[:-1] + f', "{name}": {nested}}}'
+            return FuzzCase(category, raw_body=raw_body)
+
+        if category == "oversized_body":
+            del payload[rng.choice(required)]
+            payload["padding"] = rng.choice(self.paddings())
+            return FuzzCase(category, payload, accepted_statuses=(400, 413))
+
+        if category == "malformed_json":
+            body = rng.choice(self.MALFORMED_BODIES + [json.dumps(payload)[:-rng.randint(1, 10)]])
+            return FuzzCase(category, raw_body=body)
+
+        raise ValueError(f"Unknown fuzz category: {category}")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0.0 when empty)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+# Fewer samples than this and the percentile is just the max
+PERCENTILE_MIN_SAMPLES = {95: 20, 99: 100}
+
+
+def interleave_valid_writes(cases: Iterable[FuzzCase], case_count: int,
+                            valid_writes: int) -> Iterator[Optional[FuzzCase]]:
+    """Spread valid_writes None markers evenly through cases"""
+    written = 0
+    for index, case in enumerate(cases, 1):
+        yield case
+        while written < valid_writes * index // case_count:
+            written += 1
+            yield None
+
+
+def run_concurrently(fn: Callable, items: Iterable[Any], concurrency: int) -> List[Any]:
+    """Map fn over items with a thread pool, preserving order
+
+    Items are pulled lazily, with at most 2x concurrency of them in flight.
+    """
+    concurrency = max(1, concurrency)
+    results = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= concurrency * 2:
+                results.append(pending.popleft().result())
+        results.extend(future.result() for future in pending)
+    return results
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, raising a readable ValueError for bad values"""
+    value = os.getenv(name, '').strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float environment variable, raising a readable ValueError for bad values"""
+    value = os.getenv(name, '').strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+
+
 class MommyHAIApiTester:
     """Main API testing class"""
     
@@ -58,8 +556,27 @@ class MommyHAIApiTester:
         # Session for connection pooling
         self.session = requests.Session()
         
+        # Request instrumentation (hooks + span export); bad TRACE_* values fall back to defaults
+        try:
+            sample_rate = env_float('TRACE_SAMPLE_RATE', 1.0)
+        except ValueError as e:
+            logger.warning(f"{e}; using 1.0")
+            sample_rate = 1.0
+        try:
+            export_batch_size = env_int('TRACE_EXPORT_BATCH', 100)
+        except ValueError as e:
+            logger.warning(f"{e}; using 100")
+            export_batch_size = 100
+        
+        self.tracer = RequestTracer(
+            sample_rate=sample_rate,
+            export_path=os.getenv('TRACE_EXPORT_FILE') or None,
+            export_batch_size=export_batch_size
+        )
+        
     def print_header(self, title: str):
         """Print a formatted header"""
+        self.tracer.begin_suite(title)
         print(f"\n{Fore.CYAN}{'='*60}")
         print(f"{Fore.CYAN}{title.center(60)}")
         print(f"{Fore.CYAN}{'='*60}")
@@ -84,17 +601,25 @@ class MommyHAIApiTester:
         print()
         
     def make_request(self, method: str, url: str, headers: Dict[str, str], 
-                    data: Optional[Dict] = None, expected_status: int = 200) -> TestResult:
-        """Make HTTP request and return test result"""
+                    data: Optional[Any] = None, expected_status: int = 200,
+                    raw_body: Optional[str] = None) -> TestResult:
+        """Make HTTP request and return test result (raw_body is sent verbatim instead of data)"""
         
         start_time = time.time()
         test_name = f"{method} {url.split('/')[-1] if '/' in url else url}"
+        headers = dict(headers)
+        span = self.tracer.start_span(test_name, method, url, headers)
+        response = None
         
         try:
             if method.upper() == 'GET':
                 response = self.session.get(url, headers=headers)
+            elif method.upper() == 'POST' and raw_body is not None:
+                response = self.session.post(url, headers=headers, data=raw_body.encode('utf-8'))
             elif method.upper() == 'POST':
                 response = self.session.post(url, headers=headers, json=data)
+            elif method.upper() == 'PUT' and raw_body is not None:
+                response = self.session.put(url, headers=headers, data=raw_body.encode('utf-8'))
             elif method.upper() == 'PUT':
                 response = self.session.put(url, headers=headers, json=data)
             elif method.upper() == 'DELETE':
@@ -117,7 +642,7 @@ class MommyHAIApiTester:
             success = response.status_code == expected_status
             error_message = None if success else f"Status code mismatch: got {response.status_code}, expected {expected_status}"
             
-            return TestResult(
+            result = TestResult(
                 name=test_name,
                 method=method.upper(),
                 url=url,
@@ -131,7 +656,7 @@ class MommyHAIApiTester:
             
         except Exception as e:
             duration = time.time() - start_time
-            return TestResult(
+            result = TestResult(
                 name=test_name,
                 method=method.upper(),
                 url=url,
@@ -142,6 +667,14 @@ class MommyHAIApiTester:
                 error_message=str(e),
                 duration=duration
             )
+            if response is None:
+                self.tracer.fail_span(span, e)
+        
+        # Close the span only once the result is settled, so tracing can't change it
+        if response is not None:
+            self.tracer.end_span(span, response, expected_status)
+        
+        return result
     
     def authenticate(self) -> bool:
         """Authenticate and get access token"""
@@ -162,8 +695,14 @@ class MommyHAIApiTester:
         }
         params = {"grant_type": "password"}
         
+        span = self.tracer.start_span("LOGIN", "POST", login_url, headers)
+        response = None
+        result = None
+        
         try:
+            start_time = time.time()
             response = self.session.post(f"{login_url}?grant_type=password", headers=headers, json=data)
+            duration = time.time() - start_time
             result = TestResult(
                 name="LOGIN",
                 method="POST",
@@ -172,18 +711,26 @@ class MommyHAIApiTester:
                 expected_status=200,
                 success=response.status_code == 200,
                 response_data=response.json() if response.status_code == 200 else None,
-                error_message=None if response.status_code == 200 else f"Login failed: {response.text}"
+                error_message=None if response.status_code == 200 else f"Login failed: {response.text}",
+                duration=duration
             )
-            
-            self.test_results.append(result)
-            self.print_test_result(result)
-            
-            if result.success and result.response_data:
-                self.env["token"] = result.response_data.get("access_token", "")
-                return True
-                
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
+            if response is None:
+                self.tracer.fail_span(span, e)
+        
+        if response is not None:
+            self.tracer.end_span(span, response, expected_status=200)
+        
+        if result is None:
+            return False
+        
+        self.test_results.append(result)
+        self.print_test_result(result)
+        
+        if result.success and result.response_data:
+            self.env["token"] = result.response_data.get("access_token", "")
+            return True
             
         return False
     
@@ -571,7 +1118,161 @@ class MommyHAIApiTester:
         result = self.make_request("POST", base_url, self.get_api_headers(), invalid_contact_data, expected_status=400)
         self.test_results.append(result)
         self.print_test_result(result)
-    
+
+    def test_validation_fuzz(self):
+        """Fuzz Contacts/Partners validation and compare reject latency with valid writes (needs FUZZ_CASES)"""
+        try:
+            cases_per_endpoint = env_int('FUZZ_CASES', 0)
+            concurrency = max(1, env_int('FUZZ_CONCURRENCY', 32))
+            valid_writes = max(0, env_int('FUZZ_VALID_WRITES', 100))
+            seed = env_int('FUZZ_SEED', random.randrange(2**32))
+        except ValueError as e:
+            self.print_header("VALIDATION FUZZ TESTS")
+            result = TestResult(
+                name="FUZZ configuration",
+                method="-",
+                url="",
+                status_code=0,
+                expected_status=0,
+                success=False,
+                response_data=None,
+                error_message=str(e)
+            )
+            self.test_results.append(result)
+            self.print_test_result(result)
+            return
+
+        if cases_per_endpoint <= 0:
+            return
+
+        self.print_header("VALIDATION FUZZ TESTS")
+        print(f"{Fore.CYAN}Cases per endpoint: {cases_per_endpoint}, valid writes per run: {valid_writes}, "
+              f"concurrency: {concurrency}, seed: {seed}")
+
+        # Size the connection pool so workers don't queue on the shared session
+        adapter = requests.adapters.HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        headers = self.get_api_headers()
+
+        # Valid writes go to contacts only, creating partners also provisions WooCommerce shops
+        contacts_url = f"{self.env['url']}/functions/v1/contacts"
+        valid_contact = ValidationFuzzer.SCHEMAS["contacts"]["valid"]
+
+        for endpoint in ("contacts", "partners"):
+            base_url = f"{self.env['url']}/functions/v1/{endpoint}"
+            cases = ValidationFuzzer(endpoint, seed).generate(cases_per_endpoint)
+
+            # Keep only (category, accepted_statuses, result) so payloads can be freed once sent;
+            # None is a valid write, interleaved so the baseline sees the same load as the rejects
+            def send_case(case: Optional[FuzzCase]) -> tuple:
+                if case is None:
+                    result = self.make_request("POST", contacts_url, headers, valid_contact, expected_status=201)
+                    return ValidationFuzzer.VALID_WRITE, (201,), result
+                result = self.make_request("POST", base_url, headers, case.payload,
+                                           expected_status=400, raw_body=case.raw_body)
+                return case.category, case.accepted_statuses, result
+
+            start_time = time.time()
+            case_results = run_concurrently(
+                send_case, interleave_valid_writes(cases, cases_per_endpoint, valid_writes), concurrency
+            )
+            elapsed = time.time() - start_time
+
+            write_results = [r for category, _, r in case_results if category == ValidationFuzzer.VALID_WRITE]
+            reject_results = [item for item in case_results if item[0] != ValidationFuzzer.VALID_WRITE]
+
+            # Anything created, including what the validator wrongly let through, must not stay in the database
+            self.cleanup_created(contacts_url, write_results, concurrency)
+            self.cleanup_created(base_url, [r for _, _, r in reject_results], concurrency)
+
+            write_failures = [r for r in write_results if not r.success]
+            write_latencies = [r.duration for r in write_results if r.success]
+            result = TestResult(
+                name=f"FUZZ contacts valid writes during {endpoint} run ({len(write_results)} cases)",
+                method="POST",
+                url=contacts_url,
+                status_code=write_failures[0].status_code if write_failures else 201,
+                expected_status=201,
+                success=not write_failures,
+                response_data=None,
+                error_message=f"{len(write_failures)} valid writes failed" if write_failures else None,
+                duration=percentile(write_latencies, 50)
+            )
+            self.test_results.append(result)
+            self.print_test_result(result)
+
+            by_category: Dict[str, List[tuple]] = {}
+            for category, accepted_statuses, case_result in reject_results:
+                by_category.setdefault(category, []).append((accepted_statuses, case_result))
+
+            for category, pairs in by_category.items():
+                unexpected = Counter(r.status_code for accepted, r in pairs if r.status_code not in accepted)
+                server_errors = sum(count for status, count in unexpected.items() if status >= 500)
+                transport_errors = unexpected.get(0, 0)
+
+                result = TestResult(
+                    name=f"FUZZ {endpoint} {category} ({len(pairs)} cases)",
+                    method="POST",
+                    url=base_url,
+                    status_code=unexpected.most_common(1)[0][0] if unexpected else 400,
+                    expected_status=400,
+                    success=not unexpected,
+                    response_data=None,
+                    error_message=(f"{sum(unexpected.values())} unexpected responses ({server_errors} 5xx, "
+                                   f"{transport_errors} transport failures): {dict(unexpected)}") if unexpected else None,
+                    duration=percentile([r.duration for accepted, r in pairs], 50)
+                )
+                self.test_results.append(result)
+                self.print_test_result(result)
+
+            self.print_fuzz_latency(endpoint, by_category, elapsed, len(case_results), write_latencies)
+
+    def cleanup_created(self, base_url: str, results: List[TestResult], concurrency: int):
+        """Delete resources created by successful POST results"""
+        ids = []
+        for result in results:
+            if result.status_code == 201 and isinstance(result.response_data, dict):
+                data = result.response_data.get('data') or {}
+                if isinstance(data, dict) and data.get('id'):
+                    ids.append(data['id'])
+
+        run_concurrently(
+            lambda resource_id: self.make_request("DELETE", f"{base_url}/{resource_id}", self.get_api_headers()),
+            ids, concurrency
+        )
+
+    def print_fuzz_latency(self, endpoint: str, by_category: Dict[str, List[tuple]],
+                           elapsed: float, total_requests: int, write_latencies: List[float]):
+        """Print reject path latency per category against the valid write baseline"""
+        upload_bound = ValidationFuzzer.UPLOAD_BOUND_CATEGORIES
+        reject_latencies = [r.duration for category, pairs in by_category.items()
+                            if category not in upload_bound for accepted, r in pairs]
+        write_p50 = percentile(write_latencies, 50)
+
+        print(f"{Fore.CYAN}{endpoint} run: {total_requests} requests in {elapsed:.2f}s "
+              f"({total_requests / elapsed if elapsed else 0:.1f} req/s), valid writes interleaved")
+        print(f"  {Fore.YELLOW}{'category':<18}{'samples':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'vs write':>10}")
+
+        rows = [(f"{category}*" if category in upload_bound else category, [r.duration for accepted, r in pairs])
+                for category, pairs in sorted(by_category.items())]
+        rows.append(("all rejects", reject_latencies))
+        rows.append(("valid writes", write_latencies))
+        for name, latencies in rows:
+            p50 = percentile(latencies, 50)
+            ratio = f"{p50 / write_p50:.2f}x" if write_p50 else "n/a"
+            tails = [f"{percentile(latencies, pct) * 1000:.1f}" if len(latencies) >= minimum else "n/a"
+                     for pct, minimum in PERCENTILE_MIN_SAMPLES.items()]
+            print(f"  {Fore.YELLOW}{name:<18}{len(latencies):>8}{p50 * 1000:>10.1f}{tails[0]:>10}{tails[1]:>10}{ratio:>10}")
+
+        if any(category in upload_bound for category in by_category):
+            print(f"  {Fore.YELLOW}* upload-bound, excluded from all rejects")
+        if len(write_latencies) < PERCENTILE_MIN_SAMPLES[99]:
+            print(f"  {Fore.RED}Only {len(write_latencies)} valid write samples; raise FUZZ_VALID_WRITES to at least "
+                  f"{PERCENTILE_MIN_SAMPLES[99]} for a usable p99 baseline")
+        print()
+
     def print_summary(self):
         """Print test execution summary"""
         self.print_header("TEST EXECUTION SUMMARY")
@@ -604,26 +1305,35 @@ class MommyHAIApiTester:
         
         start_time = time.time()
         
-        # Authenticate first
-        if not self.authenticate():
-            print(f"{Fore.RED}❌ Authentication failed! Skipping authenticated tests.")
-            # Run non-authenticated tests only
-            self.test_blank_api()
-        else:
-            # Run all tests
-            self.test_contacts_api()
-            self.test_blank_api()
-            self.test_partners_api()
-            self.test_users_api()
-            self.test_notifications_api()
-            # Skip user_notifications - endpoint not implemented yet
-            # self.test_user_notifications_api()
-            self.test_contacts_validation()
-        
-        end_time = time.time()
-        
-        self.print_summary()
-        print(f"\n{Fore.MAGENTA}⏱️  Total execution time: {end_time - start_time:.2f} seconds")
+        try:
+            # Authenticate first
+            if not self.authenticate():
+                print(f"{Fore.RED}❌ Authentication failed! Skipping authenticated tests.")
+                # Run non-authenticated tests only
+                self.test_blank_api()
+            else:
+                # Run all tests
+                self.test_contacts_api()
+                self.test_blank_api()
+                self.test_partners_api()
+                self.test_users_api()
+                self.test_notifications_api()
+                # Skip user_notifications - endpoint not implemented yet
+                # self.test_user_notifications_api()
+                self.test_contacts_validation()
+                self.test_validation_fuzz()
+            
+            end_time = time.time()
+            
+            self.print_summary()
+            print(f"\n{Fore.MAGENTA}⏱️  Total execution time: {end_time - start_time:.2f} seconds")
+        finally:
+            # Flush buffered spans even if the run crashed or was interrupted
+            if self.tracer.export_path:
+                self.tracer.export()
+                print(f"{Fore.MAGENTA}🔭 Exported {self.tracer.exported} spans (trace {self.tracer.trace_id}) to {self.tracer.export_path}")
+                if self.tracer.dropped:
+                    print(f"{Fore.RED}⚠️  Dropped {self.tracer.dropped} spans that could not be written")
 
 
 def main():